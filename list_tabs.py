@@ -3,9 +3,7 @@ import argparse
 import sys
 import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'tools'))
-
-from sheets import sheets_client
+from tools.sheets import sheets_client
 
 
 DEFAULT_SPREADSHEET_ID = '1_7XyowAcqKRISdMp71DQUeKA_2O2g5T89tJvsVt685I'
@@ -8,12 +8,11 @@ import argparse
 import sys
 import os
 import asyncio
+from typing import List, Optional, Tuple
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'tools'))
-
-from sheets import sheets_client
-from qa import playwright_runner
-from utils.logger import setup_logger
+from tools.sheets import sheets_client
+from tools.qa import playwright_runner
+from tools.utils.logger import setup_logger
 
 DEFAULT_SPREADSHEET_ID = '1_7XyowAcqKRISdMp71DQUeKA_2O2g5T89tJvsVt685I'
 SERVICE_ACCOUNT_FILE = 'service-account.json'
@@ -92,6 +91,53 @@ async def analyze_single_url(url: str, timeout: int = 180, logger=None):
             await browser.close()
 
 
+def build_updates(
+    row_index: int,
+    result: dict,
+    existing_mobile: Optional[str],
+    existing_desktop: Optional[str]
+) -> List[Tuple[int, str, str]]:
+    """
+    Map an analysis result to the spreadsheet cell updates it produces.
+    
+    Columns that already hold a value are left untouched. Errors are written
+    to every empty column; scores at or above SCORE_THRESHOLD become 'passed',
+    anything lower becomes the PSI URL (or the raw score if no URL is known).
+    
+    Args:
+        row_index: Spreadsheet row (1-based) the result belongs to
+        result: Result dictionary from playwright_runner
+        existing_mobile: Current value of the mobile column (or None)
+        existing_desktop: Current value of the desktop column (or None)
+        
+    Returns:
+        List of (row_index, column, value) tuples for batch_write_results()
+    """
+    updates = []
+    
+    if result['error']:
+        error_msg = f"ERROR: {result['error']}"
+        if not existing_mobile:
+            updates.append((row_index, MOBILE_COLUMN, error_msg))
+        if not existing_desktop:
+            updates.append((row_index, DESKTOP_COLUMN, error_msg))
+        return updates
+    
+    psi_url = result['psi_url']
+    for column, existing, score in (
+        (MOBILE_COLUMN, existing_mobile, result['mobile_score']),
+        (DESKTOP_COLUMN, existing_desktop, result['desktop_score'])
+    ):
+        if existing or score is None:
+            continue
+        if score >= SCORE_THRESHOLD:
+            updates.append((row_index, column, 'passed'))
+        else:
+            updates.append((row_index, column, psi_url or f"Score: {score}"))
+    
+    return updates
+
+
 def main():
     parser = argparse.ArgumentParser(description='PageSpeed Insights audit tool')
     parser.add_argument('--tab', help='Spreadsheet tab name')
@@ -244,37 +290,27 @@ def main():
             existing_mobile = metadata['existing_mobile']
             existing_desktop = metadata['existing_desktop']
             
+            updates = build_updates(row_index, result, existing_mobile, existing_desktop)
+            all_updates.extend(updates)
+            
             if result['error']:
-                # Collect error updates for empty columns
-                error_msg = f"ERROR: {result['error']}"
-                if not existing_mobile:
-                    all_updates.append((row_index, MOBILE_COLUMN, error_msg))
-                if not existing_desktop:
-                    all_updates.append((row_index, DESKTOP_COLUMN, error_msg))
                 failed += 1
                 failed_urls.append(url)
                 logger.info(f"✗ {url}: {result['error']}")
             else:
                 mobile_score = result['mobile_score']
                 desktop_score = result['desktop_score']
-                psi_url = result['psi_url']
                 
-                # Collect mobile result
                 if not existing_mobile and mobile_score is not None:
                     if mobile_score >= SCORE_THRESHOLD:
-                        all_updates.append((row_index, MOBILE_COLUMN, 'passed'))
                         mobile_pass += 1
                     else:
-                        all_updates.append((row_index, MOBILE_COLUMN, psi_url or f"Score: {mobile_score}"))
                         mobile_fail += 1
                 
-                # Collect desktop result
                 if not existing_desktop and desktop_score is not None:
                     if desktop_score >= SCORE_THRESHOLD:
-                        all_updates.append((row_index, DESKTOP_COLUMN, 'passed'))
                         desktop_pass += 1
                     else:
-                        all_updates.append((row_index, DESKTOP_COLUMN, psi_url or f"Score: {desktop_score}"))
                         desktop_fail += 1
                 
                 successful += 1
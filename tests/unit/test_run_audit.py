@@ -0,0 +1,72 @@
+import pytest
+
+from run_audit import build_updates, MOBILE_COLUMN, DESKTOP_COLUMN
+
+pytestmark = pytest.mark.unit
+
+ROW = 5
+MOBILE_PSI = 'https://pagespeed.web.dev/analysis?url=mobile'
+DESKTOP_PSI = 'https://pagespeed.web.dev/analysis?url=desktop'
+
+
+def _result(mobile_score=None, desktop_score=None, psi_url=None, error=None):
+    return {
+        'url': 'https://example.com',
+        'mobile_score': mobile_score,
+        'desktop_score': desktop_score,
+        'psi_url': psi_url,
+        'error': error
+    }
+
+
+class TestBuildUpdates:
+    @pytest.mark.parametrize('mobile_score,desktop_score,psi_url,expected', [
+        pytest.param(79, 79, MOBILE_PSI, [(ROW, MOBILE_COLUMN, MOBILE_PSI), (ROW, DESKTOP_COLUMN, MOBILE_PSI)], id='79-79'),
+        pytest.param(80, 80, MOBILE_PSI, [(ROW, MOBILE_COLUMN, 'passed'), (ROW, DESKTOP_COLUMN, 'passed')], id='80-80'),
+        pytest.param(81, 81, MOBILE_PSI, [(ROW, MOBILE_COLUMN, 'passed'), (ROW, DESKTOP_COLUMN, 'passed')], id='81-81'),
+        pytest.param(0, 0, MOBILE_PSI, [(ROW, MOBILE_COLUMN, MOBILE_PSI), (ROW, DESKTOP_COLUMN, MOBILE_PSI)], id='0-0'),
+        pytest.param(100, 100, MOBILE_PSI, [(ROW, MOBILE_COLUMN, 'passed'), (ROW, DESKTOP_COLUMN, 'passed')], id='100-100'),
+        pytest.param(79, 80, DESKTOP_PSI, [(ROW, MOBILE_COLUMN, DESKTOP_PSI), (ROW, DESKTOP_COLUMN, 'passed')], id='79-80'),
+        pytest.param(80, 79, DESKTOP_PSI, [(ROW, MOBILE_COLUMN, 'passed'), (ROW, DESKTOP_COLUMN, DESKTOP_PSI)], id='80-79'),
+        pytest.param(50, 95, None, [(ROW, MOBILE_COLUMN, 'Score: 50'), (ROW, DESKTOP_COLUMN, 'passed')], id='50-95-no-psi'),
+        pytest.param(95, 50, None, [(ROW, MOBILE_COLUMN, 'passed'), (ROW, DESKTOP_COLUMN, 'Score: 50')], id='95-50-no-psi'),
+        pytest.param(None, 85, MOBILE_PSI, [(ROW, DESKTOP_COLUMN, 'passed')], id='missing-mobile-score'),
+    ])
+    def test_score_threshold(self, mobile_score, desktop_score, psi_url, expected):
+        result = _result(mobile_score, desktop_score, psi_url)
+
+        assert build_updates(ROW, result, None, None) == expected
+
+    def test_existing_mobile_value_is_not_overwritten(self):
+        result = _result(90, 70, DESKTOP_PSI)
+
+        assert build_updates(ROW, result, 'passed', None) == [(ROW, DESKTOP_COLUMN, DESKTOP_PSI)]
+
+    def test_existing_desktop_value_is_not_overwritten(self):
+        result = _result(70, 90, MOBILE_PSI)
+
+        assert build_updates(ROW, result, None, MOBILE_PSI) == [(ROW, MOBILE_COLUMN, MOBILE_PSI)]
+
+    def test_both_columns_existing_produces_no_updates(self):
+        result = _result(90, 90, MOBILE_PSI)
+
+        assert build_updates(ROW, result, 'passed', 'passed') == []
+
+    def test_error_written_to_empty_columns(self):
+        result = _result(error='Score elements not found within 120s')
+        error_msg = 'ERROR: Score elements not found within 120s'
+
+        assert build_updates(ROW, result, None, None) == [
+            (ROW, MOBILE_COLUMN, error_msg),
+            (ROW, DESKTOP_COLUMN, error_msg)
+        ]
+
+    def test_error_skips_existing_columns(self):
+        result = _result(error='boom')
+
+        assert build_updates(ROW, result, 'passed', None) == [(ROW, DESKTOP_COLUMN, 'ERROR: boom')]
+
+    def test_error_ignores_partial_scores(self):
+        result = _result(mobile_score=95, error='boom')
+
+        assert build_updates(ROW, result, None, 'passed') == [(ROW, MOBILE_COLUMN, 'ERROR: boom')]
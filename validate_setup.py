@@ -124,11 +124,8 @@ def check_google_sheets_api() -> Tuple[bool, str]:
     if not os.path.exists('service-account.json'):
         return False, "service-account.json not found"
     
-    # Add tools to path
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'tools'))
-    
     try:
-        from sheets import sheets_client
+        from tools.sheets import sheets_client
         
         # Test authentication
         try: